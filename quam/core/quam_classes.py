@@ -19,7 +19,7 @@ from typing import (
     Optional,
 )
 from functools import partial
-from dataclasses import dataclass, fields, is_dataclass, MISSING
+from dataclasses import dataclass, fields, is_dataclass, Field, MISSING
 from collections import UserDict, UserList
 
 from quam.serialisation import AbstractSerialiser, JSONSerialiser
@@ -31,6 +31,7 @@ from quam.utils import (
     type_is_optional,
     generate_config_final_actions,
 )
+from quam.utils.general import cache_per_class
 from quam.core.quam_instantiation import instantiate_quam_class
 from .qua_config_template import qua_config_template
 
@@ -45,6 +46,20 @@ __all__ = [
 ]
 
 
+# Types that QuamList.to_dict can return as-is without any conversion
+_SCALAR_TYPES = frozenset({int, float, complex, str, bool, type(None)})
+
+
+@cache_per_class
+def _get_class_type_hints(cls: type) -> Dict[str, Any]:
+    """Get the type hints of a class, cached per class.
+
+    `typing.get_type_hints` walks the MRO and evaluates any forward references, which
+    is relatively slow. The returned dictionary is shared and should not be modified.
+    """
+    return get_type_hints(cls)
+
+
 def _get_value_annotation(cls_or_obj: Union[type, object], attr: str) -> type:
     """Get the type annotation for the values in a QuamDict or QuamList.
 
@@ -56,19 +71,67 @@ def _get_value_annotation(cls_or_obj: Union[type, object], attr: str) -> type:
         return None
 
     cls = cls_or_obj if isinstance(cls_or_obj, type) else cls_or_obj.__class__
+    return _get_class_value_annotation(cls, attr)
+
 
-    annotated_attrs = get_type_hints(cls)
+@cache_per_class
+def _get_class_value_annotation(cls: type, attr: str) -> type:
+    """Cached implementation of `_get_value_annotation` for a class"""
+    # Avoid resolving all type hints if the attribute is not a dataclass field
+    dataclass_fields = getattr(cls, "__dataclass_fields__", None)
+    if dataclass_fields is not None and attr not in dataclass_fields:
+        return None
+
+    annotated_attrs = _get_class_type_hints(cls)
     if attr not in annotated_attrs:
         return None
 
     attr_annotation = annotated_attrs[attr]
-    if get_origin(attr_annotation) == dict:
+    annotation_origin = get_origin(attr_annotation)
+    if annotation_origin == dict:
         return get_args(attr_annotation)[1]
-    elif get_origin(attr_annotation) == list:
+    elif annotation_origin == list:
         return get_args(attr_annotation)[0]
     return None
 
 
+@cache_per_class
+def _get_dataclass_fields(cls: type) -> Dict[str, Field]:
+    """Get the dataclass fields of a class, keyed by field name.
+
+    Equivalent to `dataclasses.fields(cls)`, but cached per class and indexed by name,
+    as the fields are requested for every object in `QuamBase.get_attrs`.
+    """
+    return {data_field.name: data_field for data_field in fields(cls)}
+
+
+@cache_per_class
+def _get_attr_required_type(cls: type, attr: str) -> Optional[type]:
+    """Get the type that the value of a dataclass attribute should have.
+
+    Used by `QuamBase._val_matches_attr_annotation`. The result is cached per class
+    and attribute, as determining it requires inspecting the class type hints.
+
+    Returns:
+        - None if the attribute is not an allowed dataclass attribute
+        - dict / list if the annotation is a dict / list, including e.g. Dict[str, int]
+        - The annotation otherwise. Optional annotations are unwrapped.
+    """
+    annotated_attrs = get_dataclass_attr_annotations(cls)
+    if attr not in annotated_attrs["allowed"]:
+        return None
+
+    required_type = annotated_attrs["allowed"][attr]
+    if type_is_optional(required_type):
+        required_type = get_args(required_type)[0]
+
+    if required_type == dict or get_origin(required_type) == dict:
+        return dict
+    elif required_type == list or get_origin(required_type) == list:
+        return list
+    return required_type
+
+
 def convert_dict_and_list(value, cls_or_obj=None, attr=None):
     """Convert a dict or list to a QuamDict or QuamList if possible."""
     if isinstance(value, dict):
@@ -261,7 +324,7 @@ class QuamBase(ReferenceClass):
             AssertionError if not a dataclass.
         """
         assert is_dataclass(self)
-        return [data_field.name for data_field in fields(self)]
+        return list(_get_dataclass_fields(self.__class__))
 
     def get_attr_name(self, attr_val: Any) -> str:
         """Get the name of an attribute that matches the value.
@@ -297,14 +360,18 @@ class QuamBase(ReferenceClass):
         if not is_dataclass(self):
             return False
 
-        dataclass_fields = fields(self)
-        if not any(field.name == attr for field in dataclass_fields):
+        field = _get_dataclass_fields(self.__class__).get(attr)
+        if field is None:
             return False
 
-        field = next(field for field in dataclass_fields if field.name == attr)
         if field.default is not MISSING:
             return val == field.default
         elif field.default_factory is not MISSING:
+            # Compare empty containers without instantiating a new default each time
+            if field.default_factory is list:
+                return val == []
+            elif field.default_factory is dict:
+                return val == {}
             try:
                 default_val = field.default_factory()
                 return val == default_val
@@ -320,17 +387,13 @@ class QuamBase(ReferenceClass):
         The attribute type must exactly match the annotation.
         For dict and list, no additional type check of args is performed.
         """
-        annotated_attrs = get_dataclass_attr_annotations(cls)
-        if attr not in annotated_attrs["allowed"]:
+        required_type = _get_attr_required_type(cls, attr)
+        if required_type is None:
             return False
 
-        required_type = annotated_attrs["allowed"][attr]
-        if type_is_optional(required_type):
-            required_type = get_args(required_type)[0]
-
-        if required_type == dict or get_origin(required_type) == dict:
+        if required_type is dict:
             return isinstance(val, (dict, QuamDict))
-        elif required_type == list or get_origin(required_type) == list:
+        elif required_type is list:
             return isinstance(val, (list, QuamList))
         return type(val) == required_type
 
@@ -366,17 +429,22 @@ class QuamBase(ReferenceClass):
 
         """
         attr_names = self._get_attr_names()
-
-        skip_attrs = getattr(self, "_skip_attrs", [])
-        attr_names = [attr for attr in attr_names if attr not in skip_attrs]
+        # Most classes don't define _skip_attrs, in which case no filtering is needed
+        skip_attrs = getattr(self, "_skip_attrs", None)
+        if skip_attrs:
+            attr_names = (attr for attr in attr_names if attr not in skip_attrs)
 
         if not follow_references:
-            attrs = {attr: self.get_unreferenced_value(attr) for attr in attr_names}
+            get_value = self.get_unreferenced_value
         else:
-            attrs = {attr: getattr(self, attr) for attr in attr_names}
-
-        if not include_defaults:
-            attrs = {attr: val for attr, val in attrs.items() if not self._attr_val_is_default(attr, val)}
+            get_value = partial(getattr, self)
+
+        # Defaults are filtered while collecting the values to avoid a second dict
+        attrs = {}
+        for attr in attr_names:
+            val = get_value(attr)
+            if include_defaults or not self._attr_val_is_default(attr, val):
+                attrs[attr] = val
         return attrs
 
     def to_dict(self, follow_references: bool = False, include_defaults: bool = False) -> Dict[str, Any]:
@@ -471,14 +539,15 @@ class QuamBase(ReferenceClass):
         if not string_reference.is_reference(reference):
             return reference
 
-        if string_reference.is_absolute_reference(reference) and self._root is None:
+        root = self._root
+        if root is None and string_reference.is_absolute_reference(reference):
             warnings.warn(
                 f"No QuamRoot initialized, cannot retrieve reference {reference}" f" from {self.__class__.__name__}"
             )
             return reference
 
         try:
-            return string_reference.get_referenced_value(self, reference, root=self._root)
+            return string_reference.get_referenced_value(self, reference, root=root)
         except ValueError as e:
             try:
                 ref = f"{self.__class__.__name__}: {self.get_reference()}"
@@ -772,7 +841,7 @@ class QuamDict(UserDict, QuamBase):
 
     # QuAM methods
     def _get_attr_names(self):
-        return list(self.data.keys())
+        return list(self.data)
 
     def get_attrs(self, follow_references=False, include_defaults=True) -> Dict[str, Any]:
         # TODO implement reference kwargs
@@ -790,8 +859,10 @@ class QuamDict(UserDict, QuamBase):
         Raises:
             AttributeError if not found.
         """
-        for attr_name in self._get_attr_names():
-            if attr_name in self and self[attr_name] is attr_val:
+        for attr_name, val in self.data.items():
+            if string_reference.is_reference(val):
+                val = self[attr_name]
+            if val is attr_val:
                 return attr_name
         else:
             raise AttributeError(
@@ -906,11 +977,12 @@ class QuamList(UserList, QuamBase):
         return super().__repr__()
 
     def __getitem__(self, i):
-        elem = super().__getitem__(i)
         if isinstance(i, slice):
-            # This automatically gets the referenced values
-            return list(elem)
+            # Read directly from the underlying list instead of creating a new
+            # QuamList, references are resolved relative to this list
+            return [self[k] for k in range(len(self.data))[i]]
 
+        elem = self.data[i]
         if string_reference.is_reference(elem):
             elem = self._get_referenced_value(elem)
         return elem
@@ -943,10 +1015,13 @@ class QuamList(UserList, QuamBase):
         return super().insert(i, converted_item)
 
     def extend(self, iterable: Iterator) -> None:
-        converted_iterable = [convert_dict_and_list(elem) for elem in iterable]
-        for converted_item in converted_iterable:
+        # Convert items and attach parents in a single pass over the iterable
+        converted_iterable = []
+        for elem in iterable:
+            converted_item = convert_dict_and_list(elem)
             if isinstance(converted_item, QuamBase):
                 converted_item.parent = self
+            converted_iterable.append(converted_item)
 
         return super().extend(converted_iterable)
 
@@ -991,8 +1066,13 @@ class QuamList(UserList, QuamBase):
             dictionary. This is to ensure that the object can be reconstructed when
             loading from a file.
         """
+        data = self.data
+        # Lists of plain scalars (e.g. waveform samples) need no conversion
+        if _SCALAR_TYPES.issuperset(map(type, data)):
+            return list(data)
+
         quam_list = []
-        for val in self.data:
+        for val in data:
             if isinstance(val, QuamBase):
                 quam_list.append(
                     val.to_dict(
@@ -2,6 +2,9 @@ from __future__ import annotations
 from typing import Union, Dict, Any, TYPE_CHECKING, Sequence
 from pathlib import Path
 import json
+import os
+import stat
+import uuid
 
 from quam.serialisation.base import AbstractSerialiser
 
@@ -31,12 +34,44 @@ class JSONSerialiser(AbstractSerialiser):
     def _save_dict_to_json(self, contents: Dict[str, Any], path: Path):
         """Save a dictionary to a JSON file.
 
+        The contents are first written to a temporary file in the same folder, which
+        then replaces the target file. An interrupted save therefore never leaves a
+        partially written JSON file behind.
+
         Args:
             contents: The dictionary to save.
             path: The path to save to.
         """
-        with open(path, "w") as f:
-            json.dump(contents, f, indent=4)
+        # json.dump writes every encoded chunk separately, serialising to a string
+        # first results in a single write
+        json_str = json.dumps(contents, indent=4)
+
+        # Resolve symlinks so that the link target is updated, not the link itself
+        path = Path(path).resolve()
+
+        # A unique temporary file per call, such that concurrent saves don't clash.
+        # Creating it with mode 0o666 lets the OS apply the current umask, as open()
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json_str)
+
+            # Keep the mode of the file that is replaced
+            try:
+                file_mode = stat.S_IMODE(os.stat(path).st_mode)
+            except FileNotFoundError:
+                pass
+            else:
+                os.chmod(tmp_path, file_mode)
+
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
 
     def _parse_path(
         self,
@@ -113,7 +148,6 @@ class JSONSerialiser(AbstractSerialiser):
 
         folder.mkdir(exist_ok=True)
 
-        content_mapping = content_mapping.copy()
         for component_file, components in content_mapping.items():
             if isinstance(components, str):
                 components = [components]
@@ -157,24 +191,33 @@ class JSONSerialiser(AbstractSerialiser):
             "default_foldername": None,
         }
 
-        if not path.exists():
-            raise FileNotFoundError(f"Path {path} not found, cannot load JSON.")
+        # A single stat call instead of separate exists, is_file and is_dir calls
+        try:
+            path_mode = path.stat().st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(
+                f"Path {path} not found, cannot load JSON."
+            ) from None
 
-        if path.is_file():
-            if not path.suffix == ".json":
+        if stat.S_ISREG(path_mode):
+            if not path.name.endswith(".json"):
                 raise TypeError(f"File {path} is not a JSON file.")
 
             metadata["default_filename"] = path.name
-            with open(path, "r") as f:
-                contents = json.load(f)
-        elif path.is_dir():
+            contents = json.loads(path.read_bytes())
+        elif stat.S_ISDIR(path_mode):
             metadata["default_foldername"] = str(path)
-            for file in path.iterdir():
-                if not file.suffix == ".json":
-                    continue
-
-                with open(file, "r") as f:
-                    file_contents = json.load(f)
+            # os.scandir avoids creating a Path object for every directory entry, and
+            # DirEntry.is_file usually doesn't require an additional stat call
+            with os.scandir(path) as entries:
+                json_files = [
+                    file
+                    for file in entries
+                    if file.name.endswith(".json") and file.is_file()
+                ]
+
+            for file in json_files:
+                file_contents = json.loads(Path(file.path).read_bytes())
                 contents.update(file_contents)
 
                 if file.name == self.default_filename:
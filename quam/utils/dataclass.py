@@ -5,6 +5,8 @@ import sys
 import warnings
 from typing import Dict, Union, ClassVar, get_type_hints
 
+from quam.utils.general import cache_per_class
+
 
 __all__ = ["patch_dataclass", "get_dataclass_attr_annotations"]
 
@@ -30,8 +32,25 @@ def get_dataclass_attr_annotations(
             - "allowed": allowed attributes of the class := "required" + "optional".
         For each key, the values are dictionaries with the attribute names as keys
         and the attribute types as values.
+
+    Note:
+        The annotations of a class are only determined once and then cached.
     """
+    if isinstance(cls_or_obj, type):
+        attr_annotations = _get_cached_class_attr_annotations(cls_or_obj)
+    else:
+        attr_annotations = _get_dataclass_attr_annotations(cls_or_obj)
+    # Return copies such that the cached annotations cannot be modified
+    return {key: dict(annotations) for key, annotations in attr_annotations.items()}
+
+
+def _get_dataclass_attr_annotations(
+    cls_or_obj: Union[type, object],
+) -> Dict[str, Dict[str, type]]:
+    """Determine the attributes and annotations of a dataclass
 
+    See `get_dataclass_attr_annotations` for details.
+    """
     annotated_attrs = get_type_hints(cls_or_obj)
 
     annotated_attrs.pop("_root", None)
@@ -73,6 +92,12 @@ def get_dataclass_attr_annotations(
     return attr_annotations
 
 
+@cache_per_class
+def _get_cached_class_attr_annotations(cls: type) -> Dict[str, Dict[str, type]]:
+    """Cached version of `_get_dataclass_attr_annotations` for classes"""
+    return _get_dataclass_attr_annotations(cls)
+
+
 def dataclass_field_has_default(field: dataclasses.field) -> bool:
     """Check if a dataclass field has a default value"""
     if field.default is not dataclasses.MISSING:
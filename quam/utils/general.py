@@ -1,15 +1,49 @@
+from functools import wraps
 import importlib
+import sys
 import warnings
 from inspect import isclass
-from typing import Any, Union
+from typing import Any, Callable, Union
 
 from quam.utils import string_reference
 
-from typeguard import TypeCheckError, check_type
-
 __all__ = ["get_full_class_path", "validate_obj_type", "get_class_from_path"]
 
 
+_CLASS_CACHE_ATTR = "_quam_class_cache"
+
+
+def cache_per_class(func: Callable) -> Callable:
+    """Decorator that caches the result of a function whose first argument is a class.
+
+    The cached results are stored on the class itself instead of in a global cache
+    such as `functools.lru_cache`. Classes are therefore not kept alive by the cache,
+    and can be garbage collected, e.g. when a class is redefined in a notebook.
+    Results are cached separately for subclasses.
+    Any remaining arguments must be hashable and are part of the cache key.
+    """
+
+    @wraps(func)
+    def wrapper(cls: type, *args):
+        class_cache = cls.__dict__.get(_CLASS_CACHE_ATTR)
+        if class_cache is None:
+            class_cache = {}
+            try:
+                setattr(cls, _CLASS_CACHE_ATTR, class_cache)
+            except (TypeError, AttributeError):
+                # Attributes cannot be set on e.g. builtin types
+                return func(cls, *args)
+
+        key = (wrapper, *args)
+        try:
+            return class_cache[key]
+        except KeyError:
+            result = class_cache[key] = func(cls, *args)
+            return result
+
+    return wrapper
+
+
 def get_full_class_path(cls_or_obj: Union[type, object]) -> str:
     """Returns the full path of a class or object, including the module name.
 
@@ -29,13 +63,11 @@ def get_full_class_path(cls_or_obj: Union[type, object]) -> str:
     Warnings:
         If the module name cannot be determined, a warning is raised.
     """
-    if isclass(cls_or_obj):
-        class_name = cls_or_obj.__qualname__
-    else:
-        class_name = cls_or_obj.__class__.__qualname__
+    cls = cls_or_obj if isclass(cls_or_obj) else cls_or_obj.__class__
 
-    module_name = cls_or_obj.__module__
+    module_name = cls.__module__
     if module_name == "__main__" or module_name is None:
+        class_name = cls.__qualname__
         warnings.warn(
             f"Could not determine the module of {class_name}, this may cause issues"
             " when trying to load QuAM from a file. Please ensure that all QuAM"
@@ -43,7 +75,13 @@ def get_full_class_path(cls_or_obj: Union[type, object]) -> str:
         )
         return class_name
     else:
-        return f"{module_name}.{class_name}"
+        return _get_module_class_path(cls)
+
+
+@cache_per_class
+def _get_module_class_path(cls: type) -> str:
+    """Cached class path of a class defined in a module, see `get_full_class_path`"""
+    return sys.intern(f"{cls.__module__}.{cls.__qualname__}")
 
 
 def validate_obj_type(
@@ -71,6 +109,10 @@ def validate_obj_type(
         return
     if elem is None and allow_none:
         return
+
+    # typeguard is only needed when loading QuAM and is slow to import
+    from typeguard import TypeCheckError, check_type
+
     try:
         check_type(elem, required_type)
     except TypeCheckError as e:
@@ -111,6 +153,10 @@ def get_class_from_path(class_str) -> type:
             "class path is of the form '{module_name}.{class_name}'. "
             f"class_str: '{class_str}'"
         ) from e
-    module = importlib.import_module(module_path)
+    # Modules of QuAM classes are usually already imported, in which case we can skip
+    # the relatively slow import machinery
+    module = sys.modules.get(module_path)
+    if module is None:
+        module = importlib.import_module(module_path)
     quam_class = getattr(module, class_name)
     return quam_class
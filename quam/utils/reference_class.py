@@ -4,8 +4,15 @@ from typing import Any, ClassVar
 __all__ = ["ReferenceClass"]
 
 
+_NON_REFERENCE_ATTRS = frozenset({"_is_reference", "_get_referenced_value"})
+
+
 class ReferenceClass:
-    """Class whose attributes can by references to other attributes"""
+    """Class whose attributes can by references to other attributes
+
+    References must be strings, the reference format is determined by the subclass
+    implementation of `_is_reference`.
+    """
 
     _initialized: ClassVar[bool] = False
 
@@ -34,7 +41,14 @@ class ReferenceClass:
     def __getattribute__(self, attr: str) -> Any:
         attr_val = super().__getattribute__(attr)
 
-        if attr in ["_is_reference", "_get_referenced_value", "__post_init__"]:
+        # Dunder attributes such as __dict__ and __class__ are accessed frequently
+        # internally and are never references
+        if attr in _NON_REFERENCE_ATTRS or attr.startswith("__"):
+            return attr_val
+
+        # References are always strings, which avoids calling _is_reference for
+        # methods, numbers, QuAM components etc.
+        if not isinstance(attr_val, str):
             return attr_val
 
         try:
@@ -75,14 +89,16 @@ class ReferenceClass:
         if value is None:
             return True
 
+        # Attributes set during instantiation are always valid, no need to retrieve
+        # the previous value (which usually doesn't exist yet and raises an error)
+        if not self._initialized:
+            return True
+
         try:
             original_value = self.get_unreferenced_value(attr)
         except AttributeError:
             return True
 
-        if not self._initialized:
-            return True
-
         if self._is_reference(original_value):
             if self._is_reference(value):
                 return True
@@ -1,8 +1,11 @@
-from typing import Tuple, Any
+from functools import lru_cache
+import sys
+from typing import Optional, Tuple, Any
 from collections import UserList, UserDict
 
 
 DELIMITER = "."
+PARENT_SEGMENT = "../"
 
 
 def is_reference(string: str) -> bool:
@@ -10,9 +13,11 @@ def is_reference(string: str) -> bool:
 
     A reference should be a string that starts with "#/", "#./" or "#../"
     """
-    if not isinstance(string, str):
+    if not isinstance(string, str) or string[:1] != "#":
         return False
-    return string.startswith(("#/", "#./", "#../"))
+    if string[1:2] == "/":
+        return True
+    return string.startswith(("./", "../"), 1)
 
 
 def is_absolute_reference(string: str) -> bool:
@@ -21,9 +26,7 @@ def is_absolute_reference(string: str) -> bool:
     A relative reference starts with "#./" or "#../"
     An absolute reference starts with ":" but is not followed by "./" or "../"
     """
-    if not is_reference(string):
-        return False
-    return string.startswith("#/")
+    return isinstance(string, str) and string[:2] == "#/"
 
 
 def split_next_attribute(string: str, splitter: str = "/") -> Tuple[str, str]:
@@ -48,47 +51,95 @@ def split_next_attribute(string: str, splitter: str = "/") -> Tuple[str, str]:
     return string, ""
 
 
-def get_relative_reference_value(obj, string: str) -> Any:
-    """Get the value of a reference string relative to an object
+def split_reference_path(string: str) -> Tuple[str, ...]:
+    """Split a reference string into the segments of its path
 
-    Performs recursive calls to get the value of nested references
+    Path segments are interned as they recur across many references.
 
     Args:
-        string: The reference string
+        string: The reference string, e.g. "#./a/../b"
 
     Returns:
-        The value of the reference string relative to the object
-
-    Raises:
-        AttributeError: If the object does not have the attribute
+        A tuple of path segments. Each segment is either an attribute / key / index,
+        or PARENT_SEGMENT ("../") if the next object is the parent.
+        Segments "./" are omitted as they refer to the same object.
     """
+    segments = []
     string = string.lstrip("#/")
+    while string:
+        if string.startswith("../"):
+            segments.append(PARENT_SEGMENT)
+            string = string[3:]
+        elif string.startswith("./"):
+            string = string[2:]
+        else:
+            next_attr, string = split_next_attribute(string)
+            # Interned segments are shared between references and allow fast
+            # attribute and dict key lookups
+            segments.append(sys.intern(next_attr))
+        string = string.lstrip("#/")
+    return tuple(segments)
+
+
+@lru_cache(maxsize=None)
+def _get_reference_steps(string: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Get the path segments of a reference string together with their integer index
+
+    The result is cached, such that each reference string is only parsed once.
+    Numeric segments can refer to a list index or an integer dict key. Converting
+    them once here avoids converting them every time the reference is resolved.
 
-    if not string:
-        return obj
-    if string.startswith("../"):
-        return get_relative_reference_value(obj.parent, string[3:])
-    elif string.startswith("./"):
-        return get_relative_reference_value(obj, string[2:])
+    Args:
+        string: The reference string
 
-    next_attr, remaining_string = split_next_attribute(string)
+    Returns:
+        A tuple of (segment, index) pairs, where index is the integer value of the
+        segment if it is numeric, and None otherwise.
+    """
+    return tuple(
+        (segment, int(segment) if segment.isdecimal() else None)
+        for segment in split_reference_path(string)
+    )
 
-    if next_attr.isdigit() and isinstance(obj, (list, UserList)):
+
+def _get_child_value(obj, attr: str, index: Optional[int] = None) -> Any:
+    """Get the value of an attribute, list index or dict key of an object"""
+    if index is not None and isinstance(obj, (list, UserList)):
         try:
-            obj_attr = obj[int(next_attr)]
+            return obj[index]
         except KeyError as e:
-            raise AttributeError(f"Object {obj} has no attribute {next_attr}") from e
+            raise AttributeError(f"Object {obj} has no attribute {attr}") from e
     elif isinstance(obj, (dict, UserDict)):
-        if next_attr in obj:
-            obj_attr = obj[next_attr]
-        elif next_attr.isdigit() and int(next_attr) in obj:
-            obj_attr = obj[int(next_attr)]
+        if attr in obj:
+            return obj[attr]
+        elif index is not None and index in obj:
+            return obj[index]
         else:
-            raise AttributeError(f"Object {obj} has no attribute {next_attr}")
+            raise AttributeError(f"Object {obj} has no attribute {attr}")
     else:
-        obj_attr = getattr(obj, next_attr)
+        return getattr(obj, attr)
+
+
+def get_relative_reference_value(obj, string: str) -> Any:
+    """Get the value of a reference string relative to an object
+
+    Walks the path segments of the reference string, see `split_reference_path`
+
+    Args:
+        string: The reference string
+
+    Returns:
+        The value of the reference string relative to the object
 
-    return get_relative_reference_value(obj_attr, remaining_string)
+    Raises:
+        AttributeError: If the object does not have the attribute
+    """
+    for segment, index in _get_reference_steps(string):
+        if segment == PARENT_SEGMENT:
+            obj = obj.parent
+        else:
+            obj = _get_child_value(obj, segment, index)
+    return obj
 
 
 def get_referenced_value(obj, string: str, root=None) -> Any:
@@ -78,4 +78,22 @@ def test_list_get_attrs_error():
 
 def test_list_to_dict():
     quam_list = QuamList([1, 2, 3])
-    assert quam_list.to_dict() == [1, 2, 3]
\ No newline at end of file
+    assert quam_list.to_dict() == [1, 2, 3]
+
+
+def test_quam_list_slice_with_components(BareQuamComponent):
+    component1 = BareQuamComponent()
+    component2 = BareQuamComponent()
+    quam_list = QuamList([component1, component2, 3, "#./2"])
+
+    assert quam_list[1:] == [component2, 3, 3]
+    assert quam_list[::2] == [component1, 3]
+    assert component2.parent is quam_list
+
+
+def test_quam_list_to_dict_scalars_returns_copy():
+    quam_list = QuamList([1, 2.5, "a", None, True])
+    quam_list_dict = quam_list.to_dict()
+    assert quam_list_dict == [1, 2.5, "a", None, True]
+    assert type(quam_list_dict) is list
+    assert quam_list_dict is not quam_list.data
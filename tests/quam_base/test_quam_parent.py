@@ -68,10 +68,26 @@ def test_double_parent_descriptor():
     assert d.parent is None
 
 
-@pytest.mark.parametrize("cls", [QuamBase, QuamRoot, QuamComponent, QuamDict, QuamList])
-def test_parent_quam_class(cls):
+@pytest.fixture(
+    scope="module", params=[QuamBase, QuamRoot, QuamComponent, QuamDict, QuamList]
+)
+def quam_subclass(request):
     @quam_dataclass
-    class C(cls): ...
+    class C(request.param): ...
+
+    return C
+
+
+@pytest.fixture(scope="module", params=[QuamRoot, QuamComponent])
+def quam_parent_subclass(request):
+    @quam_dataclass
+    class C(request.param): ...
+
+    return C
+
+
+def test_parent_quam_class(quam_subclass):
+    C = quam_subclass
 
     assert isinstance(C.parent, ParentDescriptor)
     c = C()
@@ -82,10 +98,8 @@ def test_parent_quam_class(cls):
 
 
 @pytest.mark.parametrize("child_cls", [QuamDict, QuamList])
-@pytest.mark.parametrize("parent_cls", [QuamRoot, QuamComponent])
-def test_quam_parent_child_dict(parent_cls, child_cls):
-    @quam_dataclass
-    class C(parent_cls): ...
+def test_quam_parent_child_dict(quam_parent_subclass, child_cls):
+    C = quam_parent_subclass
 
     d = child_cls()
     assert d.parent is None
@@ -1,4 +1,4 @@
-from dataclasses import field
+from dataclasses import dataclass, field
 from typing import List, Optional
 from quam.core.quam_classes import *
 
@@ -132,6 +132,23 @@ def test_omit_default_list_field():
     assert quam_component.to_dict() == {}
 
 
+def test_omit_default_unhashable_factory_field():
+    @dataclass
+    class DictFactory:
+        def __call__(self):
+            return {}
+
+    @quam_dataclass
+    class QuamBasicComponent(QuamComponent):
+        d: dict = field(default_factory=DictFactory())
+
+    quam_component = QuamBasicComponent()
+    assert quam_component.to_dict() == {}
+
+    quam_component.d["a"] = 1
+    assert quam_component.to_dict() == {"d": {"a": 1}}
+
+
 def test_optional_list_to_dict():
     @quam_dataclass
     class QuamBasicComponent(QuamComponent):
@@ -4,71 +4,72 @@ from quam.core.quam_classes import *
 from quam.core.quam_classes import _get_value_annotation
 
 
-def test_value_annotation_nonexisting():
-    @quam_dataclass
-    class TestQuam(QuamComponent):
-        int_val: int
-        str_val: str
+@quam_dataclass
+class QuamBasicTest(QuamComponent):
+    int_val: int
+    str_val: str
 
-    test_quam = TestQuam(int_val=1, str_val="test")
-    assert _get_value_annotation(test_quam, "nonexisting") is None
-    assert _get_value_annotation(test_quam, "int_val") is None
-    assert _get_value_annotation(test_quam, "str_val") is None
 
+@quam_dataclass
+class QuamDictTest(QuamComponent):
+    int_val: int
+    str_val: str
+    d1: dict
+    d2: Dict[str, int]
 
-def test_value_annotation_dict():
-    @quam_dataclass
-    class TestQuam(QuamComponent):
-        int_val: int
-        str_val: str
-        d1: dict
-        d2: Dict[str, int]
 
-    test_quam = TestQuam(int_val=1, str_val="test", d1={"a": 1}, d2={"a": 1})
-    assert _get_value_annotation(test_quam, "d1") is None
-    assert _get_value_annotation(test_quam, "str_val") is None
-    assert _get_value_annotation(test_quam, "d2") == int
+@quam_dataclass
+class QuamListTest(QuamComponent):
+    int_val: int
+    str_val: str
+    l1: list
+    l2: List[int]
 
 
-def test_value_annotation_list():
-    @quam_dataclass
-    class TestQuam(QuamComponent):
-        int_val: int
-        str_val: str
-        l1: list
-        l2: List[int]
+@quam_dataclass
+class BareQuamComponentTest(QuamComponent): ...
 
-    test_quam = TestQuam(int_val=1, str_val="test", l1=[1, 2, 3], l2=[1, 2, 3])
-    assert _get_value_annotation(test_quam, "l1") is None
-    assert _get_value_annotation(test_quam, "str_val") is None
-    assert _get_value_annotation(test_quam, "l2") == int
 
+@quam_dataclass
+class BareQuamRootTest(QuamRoot): ...
 
-def test_value_annotation_bare_quam_component():
-    @quam_dataclass
-    class TestQuam(QuamComponent): ...
 
-    test_quam = TestQuam()
+@quam_dataclass
+class EmptyDataclassTest: ...
 
-    assert _get_value_annotation(test_quam, "attr") is None
-    assert _get_value_annotation(TestQuam, "attr") is None
 
+@pytest.mark.parametrize("attr", ["nonexisting", "int_val", "str_val"])
+def test_value_annotation_nonexisting(attr):
+    test_quam = QuamBasicTest(int_val=1, str_val="test")
+    assert _get_value_annotation(test_quam, attr) is None
 
-def test_value_annotation_bare_quam_root():
-    from quam.core.quam_classes import _get_value_annotation
 
-    @quam_dataclass
-    class TestQuam(QuamRoot): ...
+@pytest.mark.parametrize("attr", ["d1", "str_val"])
+def test_value_annotation_dict_without_value_type(attr):
+    test_quam = QuamDictTest(int_val=1, str_val="test", d1={"a": 1}, d2={"a": 1})
+    assert _get_value_annotation(test_quam, attr) is None
 
-    assert _get_value_annotation(TestQuam, "attr") is None
 
-    assert _get_value_annotation(TestQuam(), "attr") is None
+def test_value_annotation_dict():
+    test_quam = QuamDictTest(int_val=1, str_val="test", d1={"a": 1}, d2={"a": 1})
+    assert _get_value_annotation(test_quam, "d2") is int
+
 
+@pytest.mark.parametrize("attr", ["l1", "str_val"])
+def test_value_annotation_list_without_value_type(attr):
+    test_quam = QuamListTest(int_val=1, str_val="test", l1=[1, 2, 3], l2=[1, 2, 3])
+    assert _get_value_annotation(test_quam, attr) is None
+
+
+def test_value_annotation_list():
+    test_quam = QuamListTest(int_val=1, str_val="test", l1=[1, 2, 3], l2=[1, 2, 3])
+    assert _get_value_annotation(test_quam, "l2") is int
 
-def test_type_hints_empty_dataclass():
-    @quam_dataclass
-    class C: ...
 
-    assert _get_value_annotation(C, "attr") is None
+@pytest.mark.parametrize(
+    "cls", [BareQuamComponentTest, BareQuamRootTest, EmptyDataclassTest]
+)
+def test_value_annotation_bare_class(cls):
+    assert _get_value_annotation(cls, "attr") is None
 
-    assert _get_value_annotation(C(), "attr") is None
+    assert _get_value_annotation(cls(), "attr") is None
@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
 import json
+import os
+import stat
+import sys
 import pytest
 
 from quam.serialisation import JSONSerialiser
@@ -107,3 +111,90 @@ def test_component_mamping_ignore(tmp_path):
             "a": 4,
         }
     }
+
+
+def test_serialise_failure_keeps_existing_file(tmp_path, monkeypatch):
+    quam_root = QuAM(a=1, b=[1, 2, 3])
+
+    serialiser = JSONSerialiser()
+    path = tmp_path / "quam_root.json"
+    serialiser.save(quam_root, path)
+    original_contents = path.read_text()
+
+    def failing_replace(src, dst):
+        raise OSError("Failed to replace file")
+
+    quam_root.a = 2
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        serialiser.save(quam_root, path)
+
+    assert path.read_text() == original_contents
+    assert [file.name for file in tmp_path.iterdir()] == ["quam_root.json"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Symlinks require privileges")
+def test_serialise_to_symlink_updates_target(tmp_path):
+    quam_root = QuAM(a=1, b=[1, 2, 3])
+
+    target_path = tmp_path / "target.json"
+    target_path.write_text("{}")
+    link_path = tmp_path / "quam_root.json"
+    link_path.symlink_to(target_path)
+
+    JSONSerialiser().save(quam_root, link_path)
+
+    assert link_path.is_symlink()
+    assert json.loads(target_path.read_text())["a"] == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes only")
+def test_serialise_keeps_file_mode(tmp_path):
+    quam_root = QuAM(a=1, b=[1, 2, 3])
+
+    path = tmp_path / "quam_root.json"
+    path.write_text("{}")
+    path.chmod(0o600)
+
+    JSONSerialiser().save(quam_root, path)
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    # New files get the same mode as files created with open()
+    new_path = tmp_path / "new_quam_root.json"
+    JSONSerialiser().save(quam_root, new_path)
+    reference_path = tmp_path / "reference.json"
+    reference_path.write_text("{}")
+    assert new_path.stat().st_mode == reference_path.stat().st_mode
+
+
+def test_serialise_concurrently_to_same_path(tmp_path):
+    quam_root = QuAM(a=1, b=[1, 2, 3])
+
+    serialiser = JSONSerialiser()
+    path = tmp_path / "quam_root.json"
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(serialiser.save, quam_root, path) for _ in range(8)]
+    for future in futures:
+        future.result()
+
+    assert json.loads(path.read_text())["a"] == 1
+    assert [file.name for file in tmp_path.iterdir()] == ["quam_root.json"]
+
+
+def test_load_folder_skips_non_json_files(tmp_path):
+    (tmp_path / "state.json").write_text(json.dumps({"a": 1}))
+    (tmp_path / "wiring.json").write_text(json.dumps({"b": [1, 2]}))
+    (tmp_path / "notes.txt").write_text("not JSON")
+    (tmp_path / "subfolder.json").mkdir()
+
+    contents, metadata = JSONSerialiser().load(tmp_path)
+
+    assert contents == {"a": 1, "b": [1, 2]}
+    assert metadata["default_filename"] == "state.json"
+    assert metadata["content_mapping"] == {"wiring.json": ["b"]}
+
+
+def test_load_nonexisting_path(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        JSONSerialiser().load(tmp_path / "nonexisting.json")
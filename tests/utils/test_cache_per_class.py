@@ -0,0 +1,52 @@
+import gc
+import weakref
+
+from quam.core import QuamComponent, quam_dataclass
+from quam.core.quam_classes import _get_value_annotation
+from quam.utils import get_dataclass_attr_annotations, get_full_class_path
+from quam.utils.general import cache_per_class
+
+
+def test_cache_per_class():
+    calls = []
+
+    @cache_per_class
+    def get_name(cls, suffix):
+        calls.append((cls, suffix))
+        return cls.__name__ + suffix
+
+    class A: ...
+
+    class B(A): ...
+
+    assert get_name(A, "1") == "A1"
+    assert get_name(A, "1") == "A1"
+    assert get_name(A, "2") == "A2"
+    assert get_name(B, "1") == "B1"
+    assert calls == [(A, "1"), (A, "2"), (B, "1")]
+
+
+def test_cache_per_class_builtin_type():
+    @cache_per_class
+    def get_name(cls):
+        return cls.__name__
+
+    assert get_name(int) == "int"
+    assert get_name(int) == "int"
+
+
+def test_cached_classes_can_be_garbage_collected():
+    @quam_dataclass
+    class TestQuam(QuamComponent):
+        d: dict
+
+    TestQuam(d={"a": 1}).to_dict()
+    _get_value_annotation(TestQuam, "d")
+    get_dataclass_attr_annotations(TestQuam)
+    get_full_class_path(TestQuam)
+
+    class_ref = weakref.ref(TestQuam)
+    del TestQuam
+    gc.collect()
+
+    assert class_ref() is None
@@ -56,6 +56,22 @@ def test_split_next_attribute():
     assert split_next_attribute("a/b/c") == ("a", "b/c")
 
 
+def test_split_reference_path():
+    assert split_reference_path("#/") == ()
+    assert split_reference_path("#/a") == ("a",)
+    assert split_reference_path("#/a/b") == ("a", "b")
+    assert split_reference_path("#./a/b") == ("a", "b")
+    assert split_reference_path("#./a/./b") == ("a", "b")
+    assert split_reference_path("#../a") == (PARENT_SEGMENT, "a")
+    assert split_reference_path("#../../a/0") == (
+        PARENT_SEGMENT,
+        PARENT_SEGMENT,
+        "a",
+        "0",
+    )
+    assert split_reference_path("#./a/../b") == ("a", PARENT_SEGMENT, "b")
+
+
 class DotDict(dict):
     """
     a dictionary that supports dot notation